@@ -6,7 +6,7 @@ Coordinates specialized agents for complex multi-agent tasks
 import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from enum import Enum
@@ -251,30 +251,43 @@ Respond with a structured plan in JSON format."""
                     "errors": ["No subtasks in orchestration plan"],
                 }
 
-            # Execute subtasks according to the plan
+            # Execute subtasks according to the plan, running every subtask
+            # whose dependencies are already satisfied in parallel
             execution_results = {}
             errors = []
 
-            for subtask in subtasks:
-                subtask_id = subtask.get("id", "unknown")
-                agent_id = subtask.get("assigned_agent", "unknown")
-
-                logger.info(f"Executing subtask {subtask_id} with agent {agent_id}")
-
-                try:
-                    # Delegate to specific agent
-                    result = await self.delegate_to_agent(agent_id, subtask)
-                    execution_results[subtask_id] = result
+            subtask_ids = {subtask.get("id", "unknown") for subtask in subtasks}
+            finished = set()
+            pending = list(subtasks)
+
+            while pending:
+                ready = [
+                    subtask
+                    for subtask in pending
+                    if all(
+                        dep in finished or dep not in subtask_ids
+                        for dep in self._subtask_dependencies(subtask)
+                    )
+                ]
+                if not ready:
+                    # Unsatisfiable dependencies, run what is left together
+                    ready = pending
+
+                outcomes = await self.central_brain.parallel_agent_calls(
+                    [
+                        lambda subtask=subtask: self._run_subtask(subtask)
+                        for subtask in ready
+                    ]
+                )
 
-                    if not result.get("success", False):
-                        errors.append(
-                            f"Subtask {subtask_id} failed: {result.get('error', 'Unknown error')}"
-                        )
+                for subtask_id, result, error_msg in outcomes:
+                    if result is not None:
+                        execution_results[subtask_id] = result
+                    if error_msg:
+                        errors.append(error_msg)
+                    finished.add(subtask_id)
 
-                except Exception as e:
-                    error_msg = f"Subtask {subtask_id} execution failed: {str(e)}"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
+                pending = [subtask for subtask in pending if subtask not in ready]
 
             # Synthesize results
             if execution_results and len(errors) < len(subtasks):
@@ -298,6 +311,41 @@ Respond with a structured plan in JSON format."""
             logger.error(f"Failed to execute orchestration plan: {e}")
             return {"success": False, "errors": [str(e)]}
 
+    def _subtask_dependencies(self, subtask: Dict[str, Any]) -> List[Any]:
+        """Dependencies of an LLM-planned subtask, tolerating null or scalar values"""
+        dependencies = subtask.get("dependencies") or []
+        if isinstance(dependencies, (str, int)):
+            dependencies = [dependencies]
+        elif not isinstance(dependencies, (list, tuple)):
+            return []
+        return [dep for dep in dependencies if isinstance(dep, (str, int))]
+
+    async def _run_subtask(
+        self, subtask: Dict[str, Any]
+    ) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+        """Run one subtask, turning failures into an error message"""
+        subtask_id = subtask.get("id", "unknown")
+        agent_id = subtask.get("assigned_agent", "unknown")
+
+        logger.info(f"Executing subtask {subtask_id} with agent {agent_id}")
+
+        try:
+            # Delegate to specific agent
+            result = await self.delegate_to_agent(agent_id, subtask)
+
+            if not result.get("success", False):
+                return (
+                    subtask_id,
+                    result,
+                    f"Subtask {subtask_id} failed: {result.get('error', 'Unknown error')}",
+                )
+            return subtask_id, result, None
+
+        except Exception as e:
+            error_msg = f"Subtask {subtask_id} execution failed: {str(e)}"
+            logger.error(error_msg)
+            return subtask_id, None, error_msg
+
     async def delegate_to_agent(
         self, agent_id: str, subtask: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -3,23 +3,40 @@ CelFlow Central AI Brain - Core Orchestrating Intelligence
 The main brain that coordinates all AI capabilities and system interactions
 """
 
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
 import logging
+import re
+import sys
 import time
-from typing import Dict, Any, Optional
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+)
 from datetime import datetime
+from types import MappingProxyType
 
-from .ollama_client import OllamaClient
-from .context_manager import ContextManager
-from .advanced_context_manager import AdvancedContextManager
-from .user_interface_agent import UserInterfaceAgent
-from .agent_orchestrator import AgentOrchestrator
-from .embryo_trainer import EmbryoTrainer
-from .system_controller import SystemController
-from .pattern_validator import PatternValidator
-from .proactive_suggestion_engine import ProactiveSuggestionEngine
 from .code_executor import code_executor, ai_execute_code, LAMBDA_TEMPLATES
 from .simple_algorithm_executor import SimpleAlgorithmExecutor
 
+# Clients, agents and numpy are imported when first needed, keeping this
+# module cheap to import for the API server and CLI tools
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .ollama_client import OllamaClient
+
 # Import voice interface
 try:
     from ..system.voice_interface import VoiceInterface, create_voice_interface
@@ -39,6 +56,155 @@ from ..core.enhanced_logging import central_brain_logger, lambda_logger
 logger = logging.getLogger(__name__)
 
 
+_BASE_SYSTEM_PROMPT = """You are the Central AI Brain of CelFlow, a self-creating AI operating system.
+
+Your personality:
+- Helpful and knowledgeable about the CelFlow system
+- Clear and concise in explanations
+- Proactive in offering assistance
+- Respectful of user privacy and preferences
+- Enthusiastic about AI and system capabilities
+
+Your core capabilities:
+- Answer questions about CelFlow functionality
+- Execute user commands by coordinating with specialized agents
+- Provide system status and insights
+- Offer proactive suggestions based on user patterns
+- Learn and adapt from interactions
+- Execute dynamic Python code when existing tools are insufficient (Lambda capability)"""
+
+# System prompts are static: build them once and intern them so the same
+# object is returned on every call (usable as an identity-based cache key)
+_DEFAULT_SYSTEM_PROMPT = sys.intern(_BASE_SYSTEM_PROMPT)
+_SYSTEM_PROMPTS = MappingProxyType(
+    {
+        context_type: sys.intern(_BASE_SYSTEM_PROMPT + "\n\n" + mode_prompt)
+        for context_type, mode_prompt in {
+            "chat": "You are in casual conversation mode. Be friendly and helpful.",
+            "system_control": "You are in system control mode. Focus on understanding and executing system commands safely.",
+            "agent_orchestration": "You are coordinating multiple agents. Focus on task delegation and result synthesis.",
+            "embryo_training": "You are evaluating embryo training. Focus on pattern analysis and specialization recommendations.",
+        }.items()
+    }
+)
+
+# Prefix cache keys, looked up by prompt identity
+_SYSTEM_PROMPT_KEYS = MappingProxyType(
+    {
+        id(prompt): hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        for prompt in (_DEFAULT_SYSTEM_PROMPT, *_SYSTEM_PROMPTS.values())
+    }
+)
+
+# Tokens embeddings barely distinguish ("set volume to 30" vs "to 70", "turn
+# wifi on" vs "off"); near-duplicate messages must agree on all of them
+_LITERAL_TOKEN_RE = re.compile(
+    r"\d+(?:[.,]\d+)*|\b(?:on|off|enable|disable|start|stop|open|close|"
+    r"up|down|yes|no|not|don't|never)\b"
+)
+
+
+def _literal_tokens(message: str) -> Tuple[str, ...]:
+    """Numbers and polarity words of a message, in order"""
+    return tuple(_LITERAL_TOKEN_RE.findall(message.lower()))
+
+
+def _ttl_cache(ttl_ms: int):
+    """Cache an argument-free async method's result per instance for ``ttl_ms``"""
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self):
+            entries = self._ttl_cache_entries
+            cached = entries.get(method.__name__)
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < ttl_ms / 1000:
+                return cached[1]
+
+            value = await method(self)
+            entries[method.__name__] = (now, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters get plain ones
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class InteractionResult:
+    """Outcome of a single user interaction"""
+
+    success: bool
+    message: str
+    context_type: Optional[str] = None
+    interaction_id: Optional[int] = None
+    response_time: Optional[float] = None
+    error: Optional[str] = None
+    cached: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the JSON payload returned by the API"""
+        result = {"success": self.success, "message": self.message}
+        for field_name in ("context_type", "interaction_id", "response_time", "error"):
+            value = getattr(self, field_name)
+            if value is not None:
+                result[field_name] = value
+        if self.cached:
+            result["cached"] = True
+        return result
+
+
+_OFFLINE_MESSAGE = (
+    "I apologize, but I'm not currently available. Please try again later."
+)
+
+# Read-only results returned while the brain is stopped; callers get copies
+_OFFLINE_RESULT = MappingProxyType(
+    {"success": False, "error": "Central AI Brain is not running"}
+)
+_OFFLINE_CHAT_RESULT = MappingProxyType(
+    {**_OFFLINE_RESULT, "message": _OFFLINE_MESSAGE}
+)
+_NO_SYSTEM_CONTROLLER_RESULT = MappingProxyType(
+    {"success": False, "error": "SystemController not available"}
+)
+_NO_SYSTEM_CONTROLLER_ACTION_RESULT = MappingProxyType(
+    {**_NO_SYSTEM_CONTROLLER_RESULT, "action": None}
+)
+
+
+def _offline_interaction() -> InteractionResult:
+    """InteractionResult returned while the brain is stopped"""
+    return InteractionResult(
+        success=False, error=_OFFLINE_RESULT["error"], message=_OFFLINE_MESSAGE
+    )
+
+
+def _require_running(offline_result=_OFFLINE_RESULT):
+    """Short-circuit an async method with ``offline_result`` while stopped
+
+    ``offline_result`` is either a mapping, returned as a fresh dict, or a
+    zero-argument factory for results that are not dicts.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if not self.is_running:
+                if callable(offline_result):
+                    return offline_result()
+                return dict(offline_result)
+            return await method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 class CentralAIBrain:
     """The orchestrating intelligence of CelFlow"""
 
@@ -48,7 +214,7 @@ class CentralAIBrain:
         self.context_config = config.get("context_management", {})
 
         # Core components
-        self.ollama_client = None
+        self.ollama_client: Optional[OllamaClient] = None
         self.context_manager = None
         self.advanced_context_manager = None
 
@@ -69,6 +235,68 @@ class CentralAIBrain:
         self.startup_time = None
         self.interaction_count = 0
 
+        # Cached prefix per (context type, session): (system prompt hash,
+        # Ollama context tokens, history version the chain was recorded at)
+        self._prefix_cache: Dict[Tuple[str, str], Tuple[str, List[int], int]] = {}
+        # Turns currently running per prefix slot, and slots where two turns
+        # overlapped so that neither chain covers the whole conversation
+        self._prefix_in_flight: Dict[Tuple[str, str], int] = {}
+        self._prefix_contended: set = set()
+
+        # Response cache: exact (context type, normalized message) LRU, backed
+        # by a ring buffer of recent embeddings for near-duplicate messages
+        self.response_cache_size = self.ai_config.get("response_cache_size", 1024)
+        self.semantic_cache_enabled = self.ai_config.get("semantic_cache", True)
+        # Commands and voice turns act on their exact wording, so only casual
+        # chat is matched by similarity
+        self.semantic_cache_types = frozenset(
+            self.ai_config.get("semantic_cache_types", ("chat",))
+        )
+        self.semantic_cache_threshold = self.ai_config.get(
+            "semantic_cache_threshold", 0.95
+        )
+        # Replies depend on the conversation, so entries expire, and very
+        # short messages ("yes", "why?") are never cached at all
+        self.response_cache_ttl = self.ai_config.get("response_cache_ttl", 600)
+        self.response_cache_min_chars = self.ai_config.get(
+            "response_cache_min_chars", 12
+        )
+        # Back-off after a transient embedding failure before trying again
+        self.semantic_cache_retry_after = self.ai_config.get(
+            "semantic_cache_retry_after", 60
+        )
+        self._semantic_cache_retry_at = 0.0
+        self._exact_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._semantic_cache: deque = deque(
+            maxlen=self.ai_config.get("semantic_cache_size", 256)
+        )
+
+        # Oversized inputs hold a parallel slot for a long prefill and can
+        # exhaust the model's memory: "truncate" keeps the last tokens,
+        # "reject" refuses
+        self.max_input_tokens = self.ai_config.get("max_input_tokens", 4096)
+        self.input_overflow_policy = self.ai_config.get(
+            "input_overflow_policy", "truncate"
+        )
+
+        # Per context type model overrides, e.g. a small quantized model for
+        # system_control; unrouted types use the configured model_name
+        self.model_routes: Dict[str, str] = self.ai_config.get("model_routes", {})
+
+        # Chunks buffered between Ollama and a streaming client
+        self.stream_buffer_size = self.ai_config.get("stream_buffer_size", 64)
+
+        # Context updates running in the background, drained on stop()
+        self._pending_updates: set = set()
+
+        # Built contexts keyed by (interaction type, history version), so a
+        # retry or a stream right after a reply skips rebuilding it
+        self._context_build_cache: Dict[Tuple[str, int], Tuple[float, str]] = {}
+        self.context_build_ttl = self.ai_config.get("context_build_ttl", 2.0)
+
+        # (timestamp, value) pairs for @_ttl_cache status probes
+        self._ttl_cache_entries: Dict[str, Tuple[float, Any]] = {}
+
         logger.info("CentralAIBrain initialized")
 
     async def start(self):
@@ -76,6 +304,10 @@ class CentralAIBrain:
         try:
             logger.info("🧠 Starting CelFlow Central AI Brain...")
 
+            from .ollama_client import OllamaClient
+            from .context_manager import ContextManager
+            from .advanced_context_manager import AdvancedContextManager
+
             # Initialize core components
             self.ollama_client = OllamaClient(self.ai_config)
             await self.ollama_client.start()
@@ -87,9 +319,9 @@ class CentralAIBrain:
                 self.ollama_client, self.context_manager
             )
 
-            # Validate that everything is working
-            health_status = await self.get_health_status()
-            if not health_status.get("ollama_healthy", False):
+            # Validate that everything is working; ollama_client.start() has
+            # just pinged the model, so reuse that result instead of probing again
+            if not self.ollama_client.is_healthy:
                 raise Exception("Ollama client is not healthy")
 
             self.is_running = True
@@ -101,7 +333,7 @@ class CentralAIBrain:
             logger.info("✅ Central AI Brain started successfully")
 
         except Exception as e:
-            logger.error(f"❌ Failed to start Central AI Brain: {e}")
+            logger.error("❌ Failed to start Central AI Brain: %s", e)
             raise
 
     async def stop(self):
@@ -109,43 +341,82 @@ class CentralAIBrain:
         try:
             logger.info("🛑 Stopping Central AI Brain...")
 
+            # Let background context updates land before shutting down
+            if self._pending_updates:
+                await asyncio.gather(*self._pending_updates, return_exceptions=True)
+
             if self.ollama_client:
                 await self.ollama_client.close()
 
+            self._prefix_cache.clear()
+            self._prefix_in_flight.clear()
+            self._prefix_contended.clear()
+            self._context_build_cache.clear()
+            self._ttl_cache_entries.clear()
             self.is_running = False
             logger.info("✅ Central AI Brain stopped successfully")
 
         except Exception as e:
-            logger.error(f"❌ Error stopping Central AI Brain: {e}")
+            logger.error("❌ Error stopping Central AI Brain: %s", e)
 
     async def _initialize_specialized_agents(self):
         """Initialize specialized agent components"""
         try:
-            # Initialize User Interface Agent
-            self.user_interface = UserInterfaceAgent(self)
-            logger.info("✅ UserInterfaceAgent initialized")
-
-            # Initialize Agent Orchestrator
-            self.agent_orchestrator = AgentOrchestrator(self)
-            logger.info("✅ AgentOrchestrator initialized")
-
-            # Initialize Embryo Trainer
-            self.embryo_trainer = EmbryoTrainer(self)
-            logger.info("✅ EmbryoTrainer initialized")
-
-            # Initialize System Controller
-            self.system_controller = SystemController(self)
-            logger.info("✅ SystemController initialized")
-
-            # Initialize Pattern Validator
-            self.pattern_validator = PatternValidator(self.ollama_client)
-            logger.info("✅ PatternValidator initialized")
-
-            # Initialize Proactive Suggestion Engine
-            self.proactive_suggestion_engine = ProactiveSuggestionEngine(
-                self.ollama_client, self.advanced_context_manager
+            from .user_interface_agent import UserInterfaceAgent
+            from .agent_orchestrator import AgentOrchestrator
+            from .embryo_trainer import EmbryoTrainer
+            from .system_controller import SystemController
+            from .pattern_validator import PatternValidator
+            from .proactive_suggestion_engine import ProactiveSuggestionEngine
+
+            # Construct agents concurrently: their __init__s load prompt
+            # templates from disk, so each runs in a worker thread and one
+            # failing agent does not stop the others
+            agent_factories = [
+                (
+                    "user_interface",
+                    "UserInterfaceAgent",
+                    lambda: UserInterfaceAgent(self),
+                ),
+                (
+                    "agent_orchestrator",
+                    "AgentOrchestrator",
+                    lambda: AgentOrchestrator(self),
+                ),
+                ("embryo_trainer", "EmbryoTrainer", lambda: EmbryoTrainer(self)),
+                (
+                    "system_controller",
+                    "SystemController",
+                    lambda: SystemController(self),
+                ),
+                (
+                    "pattern_validator",
+                    "PatternValidator",
+                    lambda: PatternValidator(self.ollama_client),
+                ),
+                (
+                    "proactive_suggestion_engine",
+                    "ProactiveSuggestionEngine",
+                    lambda: ProactiveSuggestionEngine(
+                        self.ollama_client, self.advanced_context_manager
+                    ),
+                ),
+            ]
+            loop = asyncio.get_event_loop()
+            agents = await asyncio.gather(
+                *(
+                    loop.run_in_executor(None, factory)
+                    for _, _, factory in agent_factories
+                ),
+                return_exceptions=True,
             )
-            logger.info("✅ ProactiveSuggestionEngine initialized")
+
+            for (attribute, name, _), agent in zip(agent_factories, agents):
+                if isinstance(agent, Exception):
+                    logger.error("❌ Failed to initialize %s: %s", name, agent)
+                    continue
+                setattr(self, attribute, agent)
+                logger.info("✅ %s initialized", name)
 
             # Initialize Voice Interface
             if VOICE_AVAILABLE:
@@ -165,190 +436,467 @@ class CentralAIBrain:
             logger.info("Specialized agents initialization completed")
 
         except Exception as e:
-            logger.error(f"Failed to initialize specialized agents: {e}")
+            logger.error("Failed to initialize specialized agents: %s", e)
             # Continue without specialized agents for now
             logger.warning("Continuing without some specialized agents")
 
+    @_require_running(_offline_interaction)
     async def process_user_input(
-        self, user_message: str, context_type: str = "chat"
-    ) -> Dict[str, Any]:
+        self,
+        user_message: str,
+        context_type: str = "chat",
+        session_id: Optional[str] = None,
+    ) -> InteractionResult:
         """Main entry point for user interactions"""
 
-        if not self.is_running:
-            return {
-                "success": False,
-                "error": "Central AI Brain is not running",
-                "message": "I apologize, but I'm not currently available. Please try again later.",
-            }
-
         try:
+            # Guard against pathological prefills before anything else runs
+            token_count = await self.ollama_client.count_tokens(user_message)
+            if token_count > self.max_input_tokens:
+                if self.input_overflow_policy == "reject":
+                    return InteractionResult(
+                        success=False,
+                        error=f"Input too long: {int(token_count)} tokens "
+                        f"(max {self.max_input_tokens})",
+                        message="Your message is too long for me to process. Please shorten it and try again.",
+                    )
+                logger.warning(
+                    "User input too long (%d tokens), keeping the last %d",
+                    token_count,
+                    self.max_input_tokens,
+                )
+                user_message = self.ollama_client.truncate_to_tokens(
+                    user_message, self.max_input_tokens
+                )
+
             self.interaction_count += 1
-            start_time = datetime.now()
+            interaction_id = self.interaction_count
+            start = time.perf_counter()
 
-            # Build context for this interaction
-            context = await self.context_manager.build_context(
-                interaction_type=context_type, user_message=user_message
+            # Serve repeated or near-duplicate messages without the LLM
+            cache_key = self._response_cache_key(context_type, user_message)
+            cached_response, embedding = await self._lookup_cached_response(
+                cache_key, context_type, user_message
             )
+            if cached_response is not None:
+                self._update_context_in_background(
+                    {
+                        "user_message": user_message,
+                        "assistant_response": cached_response,
+                        "context_type": context_type,
+                        "metadata": {
+                            "interaction_id": interaction_id,
+                            "cached": True,
+                        },
+                    }
+                )
+                return InteractionResult(
+                    success=True,
+                    message=cached_response,
+                    context_type=context_type,
+                    interaction_id=interaction_id,
+                    response_time=time.perf_counter() - start,
+                    cached=True,
+                )
 
-            # Generate system prompt based on context type
-            system_prompt = self._get_system_prompt(context_type)
+            system_prompt, prefix_key = self._get_prompt_prefix(context_type)
+            model = self.model_routes.get(context_type)
+
+            # Ollama context chains are only continued within one session
+            prefix_slot = (context_type, session_id) if session_id else None
+            context_tokens = self._claim_prefix(prefix_slot, prefix_key)
+            handed_off = False
+            try:
+                if context_tokens:
+                    # Ollama already holds the system prompt and earlier turns
+                    # in its KV cache, so only the new turn needs to be sent
+                    completion = await self.ollama_client.generate_completion(
+                        prompt=user_message, context_tokens=context_tokens, model=model
+                    )
+                else:
+                    # Build context for this interaction
+                    context = await self._cached_build_context(
+                        context_type, user_message
+                    )
 
-            # Generate response using Ollama
-            response = await self.ollama_client.generate_response(
-                prompt=user_message,
-                context={"conversation_history": context},
-                system_prompt=system_prompt,
-            )
+                    # Generate response using Ollama
+                    completion = await self.ollama_client.generate_completion(
+                        prompt=user_message,
+                        context={"conversation_history": [context]},
+                        system_prompt=system_prompt,
+                        model=model,
+                    )
 
-            # Update context with this interaction
-            await self.context_manager.update_context(
-                {
-                    "user_message": user_message,
-                    "assistant_response": response,
-                    "context_type": context_type,
-                    "metadata": {
-                        "interaction_id": self.interaction_count,
-                        "response_time": (datetime.now() - start_time).total_seconds(),
+                response = completion.content
+                if response:
+                    self._store_cached_response(
+                        cache_key, context_type, user_message, embedding, response
+                    )
+
+                elapsed = time.perf_counter() - start
+
+                # Update context off the critical path so the reply returns now
+                self._update_context_in_background(
+                    {
+                        "user_message": user_message,
+                        "assistant_response": response,
+                        "context_type": context_type,
+                        "metadata": {
+                            "interaction_id": interaction_id,
+                            "response_time": elapsed,
+                        },
                     },
-                }
+                    prefix=(prefix_slot, prefix_key, completion.context),
+                )
+                # The background update releases the slot from here on
+                handed_off = True
+            finally:
+                if not handed_off:
+                    # Failed or cancelled turn: free the slot, keep no chain
+                    self._release_prefix(prefix_slot)
+
+            return InteractionResult(
+                success=True,
+                message=response,
+                context_type=context_type,
+                interaction_id=interaction_id,
+                response_time=elapsed,
             )
 
-            return {
-                "success": True,
-                "message": response,
-                "context_type": context_type,
-                "interaction_id": self.interaction_count,
-                "response_time": (datetime.now() - start_time).total_seconds(),
-            }
+        except Exception as e:
+            logger.error("Error processing user input: %s", e)
+            return InteractionResult(
+                success=False,
+                error=str(e),
+                message="I apologize, but I encountered an error processing your request. Please try again.",
+            )
 
+    async def _cached_build_context(self, context_type: str, user_message: str) -> str:
+        """Build the interaction context, reusing it while history is unchanged"""
+        version = getattr(self.context_manager, "history_version", None)
+        if version is None:
+            return await self.context_manager.build_context(
+                interaction_type=context_type, user_message=user_message
+            )
+
+        key = (context_type, version)
+        now = time.monotonic()
+        cached = self._context_build_cache.get(key)
+        if cached is not None and now - cached[0] < self.context_build_ttl:
+            return cached[1]
+
+        context = await self.context_manager.build_context(
+            interaction_type=context_type, user_message=user_message
+        )
+
+        # Entries for older history versions can never hit again
+        self._context_build_cache = {
+            k: v
+            for k, v in self._context_build_cache.items()
+            if k[1] == version and now - v[0] < self.context_build_ttl
+        }
+        self._context_build_cache[key] = (now, context)
+        return context
+
+    def _update_context_in_background(
+        self,
+        interaction: Dict[str, Any],
+        prefix: Optional[Tuple] = None,
+    ):
+        """Record an interaction without making the caller wait for it"""
+        task = asyncio.create_task(self._update_context(interaction, prefix))
+        self._pending_updates.add(task)
+        task.add_done_callback(self._pending_updates.discard)
+
+    async def _update_context(
+        self,
+        interaction: Dict[str, Any],
+        prefix: Optional[Tuple] = None,
+    ):
+        """Apply a context update, logging failures since nobody awaits it"""
+        updated = False
+        try:
+            await self.context_manager.update_context(interaction)
+            updated = True
         except Exception as e:
-            logger.error(f"Error processing user input: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "I apologize, but I encountered an error processing your request. Please try again.",
-            }
+            logger.error("Error updating context: %s", e)
+        finally:
+            # Released after the update so a kept chain is tagged with the
+            # history version that already includes this turn
+            if prefix:
+                slot, prefix_key, context_tokens = prefix
+                self._release_prefix(
+                    slot, prefix_key, context_tokens if updated else None
+                )
+
+    def _get_prompt_prefix(self, context_type: str) -> Tuple[str, str]:
+        """Get the system prompt and its precomputed prefix cache key"""
+        system_prompt = self._get_system_prompt(context_type)
+        return system_prompt, _SYSTEM_PROMPT_KEYS[id(system_prompt)]
+
+    def _claim_prefix(
+        self, slot: Optional[Tuple[str, str]], prefix_key: str
+    ) -> Optional[List[int]]:
+        """Take the cached context tokens for a turn if they are still current"""
+        if slot is None:
+            return None
+
+        running = self._prefix_in_flight.get(slot, 0)
+        self._prefix_in_flight[slot] = running + 1
+        cached = self._prefix_cache.pop(slot, None)
+        if running:
+            # Overlapping turns would each continue from the same chain
+            self._prefix_contended.add(slot)
+            return None
+
+        version = getattr(self.context_manager, "history_version", None)
+        if cached and cached[0] == prefix_key and cached[2] == version:
+            return cached[1]
+        # Other paths wrote to history since, so the chain is missing turns
+        return None
+
+    def _release_prefix(
+        self,
+        slot: Optional[Tuple[str, str]],
+        prefix_key: Optional[str] = None,
+        context_tokens: Optional[List[int]] = None,
+    ):
+        """Finish a turn, keeping its context tokens for the next one if valid"""
+        if slot is None:
+            return
+
+        running = self._prefix_in_flight.pop(slot, 1) - 1
+        contended = slot in self._prefix_contended
+        if running:
+            self._prefix_in_flight[slot] = running
+        else:
+            self._prefix_contended.discard(slot)
+
+        version = getattr(self.context_manager, "history_version", None)
+        max_prefix_tokens = (
+            self.ollama_client.context_window - self.ollama_client.max_tokens
+        )
+        # History is shared, so only chains recorded at the current version
+        # can still be continued; drop the rest instead of holding them
+        self._prefix_cache = {
+            other: entry
+            for other, entry in self._prefix_cache.items()
+            if other != slot and entry[2] == version
+        }
+        if (
+            context_tokens
+            and not contended
+            and version is not None
+            and len(context_tokens) < max_prefix_tokens
+        ):
+            self._prefix_cache[slot] = (prefix_key, context_tokens, version)
+        # Otherwise (too long, missing or racing) rebuild from history next turn
+
+    def _response_cache_key(self, context_type: str, message: str) -> Optional[str]:
+        """Exact-match cache key for a whitespace/case-normalized message"""
+        normalized = " ".join(message.lower().split())
+        if len(normalized) < self.response_cache_min_chars:
+            # Too short to mean the same thing outside its conversation
+            return None
+        return hashlib.blake2b(
+            f"{context_type}\x00{normalized}".encode(), digest_size=16
+        ).hexdigest()
+
+    async def _lookup_cached_response(
+        self, cache_key: Optional[str], context_type: str, message: str
+    ) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """Find a cached response, returning the message embedding on a miss"""
+        if cache_key is None:
+            return None, None
+
+        now = time.monotonic()
+        cached = self._exact_cache.get(cache_key)
+        if cached is not None:
+            if now - cached[0] < self.response_cache_ttl:
+                self._exact_cache.move_to_end(cache_key)
+                return cached[1], None
+            del self._exact_cache[cache_key]
+
+        if (
+            not self.semantic_cache_enabled
+            or context_type not in self.semantic_cache_types
+            or now < self._semantic_cache_retry_at
+        ):
+            return None, None
+
+        import numpy as np
+
+        try:
+            embedding = np.asarray(
+                await self.ollama_client.embed(message), dtype=np.float32
+            )
+        except Exception as e:
+            if getattr(e, "status", None) == 404:
+                # Embedding model not pulled: fall back to exact matches only
+                logger.warning("Disabling semantic response cache: %s", e)
+                self.semantic_cache_enabled = False
+            else:
+                # Busy or unreachable server: skip the tier for a while
+                logger.warning(
+                    "Semantic response cache unavailable for %ss: %r",
+                    self.semantic_cache_retry_after,
+                    e,
+                )
+                self._semantic_cache_retry_at = now + self.semantic_cache_retry_after
+            return None, None
+
+        norm = np.linalg.norm(embedding)
+        if not norm:
+            return None, None
+        embedding /= norm
+
+        literals = _literal_tokens(message)
+        candidates = [
+            (vector, response)
+            for cached_type, cached_literals, vector, response, stored_at in (
+                self._semantic_cache
+            )
+            if cached_type == context_type
+            and cached_literals == literals
+            and vector.shape == embedding.shape
+            and now - stored_at < self.response_cache_ttl
+        ]
+        if candidates:
+            similarities = np.stack([vector for vector, _ in candidates]) @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] > self.semantic_cache_threshold:
+                return candidates[best][1], embedding
 
+        return None, embedding
+
+    def _store_cached_response(
+        self,
+        cache_key: Optional[str],
+        context_type: str,
+        message: str,
+        embedding: Optional[np.ndarray],
+        response: str,
+    ):
+        """Remember a successful response in both cache tiers"""
+        if cache_key is None:
+            return
+
+        now = time.monotonic()
+        self._exact_cache[cache_key] = (now, response)
+        self._exact_cache.move_to_end(cache_key)
+        while len(self._exact_cache) > self.response_cache_size:
+            self._exact_cache.popitem(last=False)
+
+        if embedding is not None:
+            self._semantic_cache.append(
+                (context_type, _literal_tokens(message), embedding, response, now)
+            )
+
+    @_require_running(_OFFLINE_CHAT_RESULT)
     async def chat_with_user_interface_agent(
         self, message: str, context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Process user input through the specialized User Interface Agent"""
 
-        if not self.is_running:
-            return {
-                "success": False,
-                "error": "Central AI Brain is not running",
-                "message": "I apologize, but I'm not currently available. Please try again later.",
-            }
-
         if not self.user_interface:
             # Fallback to basic processing if UserInterfaceAgent not available
-            return await self.process_user_input(message, "chat")
+            return (await self.process_user_input(message, "chat")).to_dict()
 
         try:
             # Use the specialized User Interface Agent
             return await self.user_interface.process_chat_message(message, context)
 
         except Exception as e:
-            logger.error(f"Error with User Interface Agent: {e}")
+            logger.error("Error with User Interface Agent: %s", e)
             # Fallback to basic processing
-            return await self.process_user_input(message, "chat")
+            return (await self.process_user_input(message, "chat")).to_dict()
 
     async def stream_user_response(self, user_message: str, context_type: str = "chat"):
         """Stream response for real-time chat interface"""
 
         if not self.is_running:
-            yield "I apologize, but I'm not currently available. Please try again later."
+            yield _OFFLINE_MESSAGE
             return
 
         try:
             # Build context
-            context = await self.context_manager.build_context(
-                interaction_type=context_type, user_message=user_message
+            context = await self._cached_build_context(context_type, user_message)
+
+            system_prompt, _ = self._get_prompt_prefix(context_type)
+
+            # Ollama keeps generating into a bounded buffer while the client
+            # drains it, so a slow reader doesn't stall generation per token
+            buffer: asyncio.Queue = asyncio.Queue(maxsize=self.stream_buffer_size)
+            producer = asyncio.create_task(
+                self._produce_stream(
+                    buffer, user_message, context_type, context, system_prompt
+                )
             )
 
-            system_prompt = self._get_system_prompt(context_type)
+            try:
+                while True:
+                    chunk = await buffer.get()
+                    if chunk is None:
+                        break
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    yield chunk
+            finally:
+                # Client went away mid-stream: stop generating
+                if not producer.done():
+                    producer.cancel()
+
+        except Exception as e:
+            logger.error("Error streaming response: %s", e)
+            yield "I apologize, but I encountered an error. Please try again."
 
-            # Stream response
-            full_response = ""
+    async def _produce_stream(
+        self,
+        buffer: asyncio.Queue,
+        user_message: str,
+        context_type: str,
+        context: str,
+        system_prompt: str,
+    ):
+        """Pull chunks from Ollama into the buffer, ending with a None sentinel"""
+        try:
+            # Chunks are joined once at the end rather than concatenated per token
+            chunks = []
             async for chunk in self.ollama_client.stream_response(
                 prompt=user_message,
-                context={"conversation_history": context},
+                context={"conversation_history": [context]},
                 system_prompt=system_prompt,
+                model=self.model_routes.get(context_type),
             ):
-                full_response += chunk
-                yield chunk
+                chunks.append(chunk)
+                await buffer.put(chunk)
 
-            # Update context after streaming is complete
-            await self.context_manager.update_context(
+            # Record the turn as soon as generation ends, not when the
+            # client finishes reading it
+            self._update_context_in_background(
                 {
                     "user_message": user_message,
-                    "assistant_response": full_response,
+                    "assistant_response": "".join(chunks),
                     "context_type": context_type,
                     "metadata": {"interaction_id": self.interaction_count},
                 }
             )
+            await buffer.put(None)
 
         except Exception as e:
-            logger.error(f"Error streaming response: {e}")
-            yield "I apologize, but I encountered an error. Please try again."
+            await buffer.put(e)
 
     def _get_system_prompt(self, context_type: str) -> str:
         """Get appropriate system prompt based on context type"""
+        return _SYSTEM_PROMPTS.get(context_type, _DEFAULT_SYSTEM_PROMPT)
 
-        base_prompt = """You are the Central AI Brain of CelFlow, a self-creating AI operating system.
-
-Your personality:
-- Helpful and knowledgeable about the CelFlow system
-- Clear and concise in explanations
-- Proactive in offering assistance
-- Respectful of user privacy and preferences
-- Enthusiastic about AI and system capabilities
-
-Your core capabilities:
-- Answer questions about CelFlow functionality
-- Execute user commands by coordinating with specialized agents
-- Provide system status and insights
-- Offer proactive suggestions based on user patterns
-- Learn and adapt from interactions
-- Execute dynamic Python code when existing tools are insufficient (Lambda capability)"""
-
-        if context_type == "chat":
-            return (
-                base_prompt
-                + "\n\nYou are in casual conversation mode. Be friendly and helpful."
-            )
-
-        elif context_type == "system_control":
-            return (
-                base_prompt
-                + "\n\nYou are in system control mode. Focus on understanding and executing system commands safely."
-            )
-
-        elif context_type == "agent_orchestration":
-            return (
-                base_prompt
-                + "\n\nYou are coordinating multiple agents. Focus on task delegation and result synthesis."
-            )
-
-        elif context_type == "embryo_training":
-            return (
-                base_prompt
-                + "\n\nYou are evaluating embryo training. Focus on pattern analysis and specialization recommendations."
-            )
-
-        else:
-            return base_prompt
-
+    @_require_running()
     async def coordinate_system_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
         """Coordinate complex system actions"""
 
-        if not self.is_running:
-            return {"success": False, "error": "Central AI Brain is not running"}
-
         try:
             action_type = action.get("type", "unknown")
-            logger.info(f"Coordinating system action: {action_type}")
+            logger.info("Coordinating system action: %s", action_type)
 
             # This is a placeholder for system action coordination
             # Will be implemented with specialized agents
@@ -361,22 +909,20 @@ Your core capabilities:
             }
 
         except Exception as e:
-            logger.error(f"Error coordinating system action: {e}")
+            logger.error("Error coordinating system action: %s", e)
             return {"success": False, "error": str(e)}
 
+    @_require_running()
     async def orchestrate_complex_task(
         self, task_description: str, context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Orchestrate complex tasks using multiple specialized agents"""
 
-        if not self.is_running:
-            return {"success": False, "error": "Central AI Brain is not running"}
-
         if not self.agent_orchestrator:
             return {"success": False, "error": "Agent Orchestrator not available"}
 
         try:
-            logger.info(f"🎭 Orchestrating complex task: {task_description[:50]}...")
+            logger.info("🎭 Orchestrating complex task: %s...", task_description[:50])
 
             # Delegate to Agent Orchestrator
             result = await self.agent_orchestrator.coordinate_task(
@@ -384,14 +930,26 @@ Your core capabilities:
             )
 
             logger.info(
-                f"✅ Task orchestration completed: {result.get('success', False)}"
+                "✅ Task orchestration completed: %s", result.get("success", False)
             )
             return result
 
         except Exception as e:
-            logger.error(f"Error orchestrating complex task: {e}")
+            logger.error("Error orchestrating complex task: %s", e)
             return {"success": False, "error": str(e)}
 
+    async def parallel_agent_calls(
+        self, calls: List[Callable[[], Awaitable[Any]]]
+    ) -> List[Any]:
+        """Run independent agent calls concurrently, returning results in order"""
+        if not hasattr(asyncio, "TaskGroup"):
+            # Python < 3.11: gather still fails fast on the first error
+            return list(await asyncio.gather(*(call() for call in calls)))
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(call()) for call in calls]
+        return [task.result() for task in tasks]
+
     async def get_health_status(self) -> Dict[str, Any]:
         """Get comprehensive health status of Central AI Brain"""
 
@@ -405,20 +963,39 @@ Your core capabilities:
             "context_manager_status": None,
         }
 
-        # Check Ollama client health
-        if self.ollama_client:
-            ollama_status = self.ollama_client.get_health_status()
+        # Probe Ollama client health and context manager status concurrently,
+        # off the event loop in case either getter blocks
+        ollama_status, context_summary = await asyncio.gather(
+            self._probe_ollama_status(), self._probe_context_summary()
+        )
+
+        if ollama_status is not None:
             status["ollama_healthy"] = ollama_status.get("is_healthy", False)
             status["ollama_model"] = ollama_status.get("model_name", "unknown")
 
-        # Check context manager status
-        if self.context_manager:
-            status["context_manager_status"] = (
-                self.context_manager.get_context_summary()
-            )
+        if context_summary is not None:
+            status["context_manager_status"] = context_summary
 
         return status
 
+    @_ttl_cache(500)
+    async def _probe_ollama_status(self) -> Optional[Dict[str, Any]]:
+        """Ollama health, shared by bursts of dashboard polls"""
+        return await self._run_probe(self.ollama_client, "get_health_status")
+
+    @_ttl_cache(500)
+    async def _probe_context_summary(self) -> Optional[Dict[str, Any]]:
+        """Context manager summary, shared by bursts of dashboard polls"""
+        return await self._run_probe(self.context_manager, "get_context_summary")
+
+    async def _run_probe(self, component: Any, method_name: str) -> Any:
+        """Call a component's synchronous status getter in a worker thread"""
+        if not component:
+            return None
+        return await asyncio.get_event_loop().run_in_executor(
+            None, getattr(component, method_name)
+        )
+
     async def get_system_insights(self) -> Dict[str, Any]:
         """Get insights about system usage and patterns"""
 
@@ -437,8 +1014,9 @@ Your core capabilities:
                 uptime.total_seconds() / 3600
             )
 
-        if self.context_manager:
-            insights["context_insights"] = self.context_manager.get_context_summary()
+        context_summary = await self._probe_context_summary()
+        if context_summary is not None:
+            insights["context_insights"] = context_summary
 
         return insights
 
@@ -449,7 +1027,7 @@ Your core capabilities:
             await self.context_manager.update_context(
                 {
                     "system_state": state_update,
-                    "metadata": {"update_time": datetime.now().isoformat()},
+                    "metadata": {"update_time": time.time()},
                 }
             )
 
@@ -504,85 +1082,79 @@ Your core capabilities:
             }
 
         except Exception as e:
-            logger.error(f"Error validating patterns: {e}")
+            logger.error("Error validating patterns: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "patterns_validated": 0,
             }
 
+    @_require_running()
     async def generate_training_labels(self, events: list) -> Dict[str, Any]:
         """Generate intelligent training labels for events"""
 
-        if not self.is_running:
-            return {"success": False, "error": "Central AI Brain is not running"}
-
         if not self.embryo_trainer:
             return {"success": False, "error": "Embryo Trainer not available"}
 
         try:
-            logger.info(f"🏷️ Generating training labels for {len(events)} events")
+            logger.info("🏷️ Generating training labels for %s events", len(events))
 
             # Delegate to Embryo Trainer
             result = await self.embryo_trainer.generate_training_labels(events)
 
-            logger.info(f"✅ Training labels generated: {result.get('success', False)}")
+            logger.info("✅ Training labels generated: %s", result.get("success", False))
             return result
 
         except Exception as e:
-            logger.error(f"Error generating training labels: {e}")
+            logger.error("Error generating training labels: %s", e)
             return {"success": False, "error": str(e)}
 
+    @_require_running()
     async def validate_embryo_training(
         self, embryo_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Validate embryo training quality and coherence"""
 
-        if not self.is_running:
-            return {"success": False, "error": "Central AI Brain is not running"}
-
         if not self.embryo_trainer:
             return {"success": False, "error": "Embryo Trainer not available"}
 
         try:
             embryo_id = embryo_data.get("id", "unknown")
-            logger.info(f"🧬 Validating embryo training: {embryo_id}")
+            logger.info("🧬 Validating embryo training: %s", embryo_id)
 
             # Delegate to Embryo Trainer
             result = await self.embryo_trainer.validate_embryo_training(embryo_data)
 
             logger.info(
-                f"✅ Embryo validation completed: {result.get('success', False)}"
+                "✅ Embryo validation completed: %s", result.get("success", False)
             )
             return result
 
         except Exception as e:
-            logger.error(f"Error validating embryo training: {e}")
+            logger.error("Error validating embryo training: %s", e)
             return {"success": False, "error": str(e)}
 
+    @_require_running()
     async def assess_embryo_birth_readiness(
         self, embryo_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Assess if embryo is ready for agent birth"""
 
-        if not self.is_running:
-            return {"success": False, "error": "Central AI Brain is not running"}
-
         if not self.embryo_trainer:
             return {"success": False, "error": "Embryo Trainer not available"}
 
         try:
             embryo_id = embryo_data.get("id", "unknown")
-            logger.info(f"🎯 Assessing birth readiness: {embryo_id}")
+            logger.info("🎯 Assessing birth readiness: %s", embryo_id)
 
             # Delegate to Embryo Trainer
             result = await self.embryo_trainer.assess_birth_readiness(embryo_data)
 
-            logger.info(f"✅ Birth readiness assessed: {result.get('success', False)}")
+            logger.info("✅ Birth readiness assessed: %s", result.get("success", False))
             return result
 
         except Exception as e:
-            logger.error(f"Error assessing birth readiness: {e}")
+            logger.error("Error assessing birth readiness: %s", e)
             return {"success": False, "error": str(e)}
 
     def get_status_summary(self) -> str:
@@ -598,16 +1170,13 @@ Your core capabilities:
 
         return f"🟢 Central AI Brain is online{uptime} - {self.interaction_count} interactions processed"
 
+    @_require_running(_NO_SYSTEM_CONTROLLER_ACTION_RESULT)
     async def translate_user_command(
         self, user_command: str, user_context: Dict[str, Any] = None
     ) -> Dict[str, Any]:
         """Translate natural language command into system action"""
-        if not self.is_running or not self.system_controller:
-            return {
-                "success": False,
-                "error": "SystemController not available",
-                "action": None,
-            }
+        if not self.system_controller:
+            return dict(_NO_SYSTEM_CONTROLLER_ACTION_RESULT)
 
         try:
             system_action = await self.system_controller.translate_user_command(
@@ -620,26 +1189,24 @@ Your core capabilities:
             }
 
         except Exception as e:
-            logger.error(f"Error translating user command: {e}")
+            logger.error("Error translating user command: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "action": None,
             }
 
+    @_require_running(_NO_SYSTEM_CONTROLLER_RESULT)
     async def execute_system_action(self, action) -> Dict[str, Any]:
         """Execute a validated system action"""
-        if not self.is_running or not self.system_controller:
-            return {
-                "success": False,
-                "error": "SystemController not available",
-            }
+        if not self.system_controller:
+            return dict(_NO_SYSTEM_CONTROLLER_RESULT)
 
         try:
             return await self.system_controller.execute_system_action(action)
 
         except Exception as e:
-            logger.error(f"Error executing system action: {e}")
+            logger.error("Error executing system action: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -692,7 +1259,7 @@ Your core capabilities:
             }
 
         except Exception as e:
-            logger.error(f"Error processing user command: {e}")
+            logger.error("Error processing user command: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -720,7 +1287,7 @@ Your core capabilities:
             )
             return {"success": True, **analysis_result}
         except Exception as e:
-            logger.error(f"Error analyzing user patterns: {e}")
+            logger.error("Error analyzing user patterns: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -759,7 +1326,7 @@ Your core capabilities:
                 ],
             }
         except Exception as e:
-            logger.error(f"Error generating context insights: {e}")
+            logger.error("Error generating context insights: %s", e)
             return {"success": False, "error": str(e), "insights": []}
 
     async def optimize_context_memory(self) -> Dict[str, Any]:
@@ -773,7 +1340,7 @@ Your core capabilities:
             )
             return {"success": True, **optimization_result}
         except Exception as e:
-            logger.error(f"Error optimizing context memory: {e}")
+            logger.error("Error optimizing context memory: %s", e)
             return {"success": False, "error": str(e)}
 
     def get_advanced_context_metrics(self) -> Dict[str, Any]:
@@ -789,7 +1356,7 @@ Your core capabilities:
             metrics = self.advanced_context_manager.get_advanced_metrics()
             return {"success": True, "metrics": metrics}
         except Exception as e:
-            logger.error(f"Error getting advanced context metrics: {e}")
+            logger.error("Error getting advanced context metrics: %s", e)
             return {"success": False, "error": str(e), "metrics": {}}
 
     async def generate_proactive_suggestions(
@@ -848,7 +1415,7 @@ Your core capabilities:
             }
 
         except Exception as e:
-            logger.error(f"Error generating proactive suggestions: {e}")
+            logger.error("Error generating proactive suggestions: %s", e)
             return {"success": False, "error": str(e), "suggestions": []}
 
     async def get_immediate_suggestions(
@@ -888,7 +1455,7 @@ Your core capabilities:
             }
 
         except Exception as e:
-            logger.error(f"Error getting immediate suggestions: {e}")
+            logger.error("Error getting immediate suggestions: %s", e)
             return {"success": False, "error": str(e), "suggestions": []}
 
     async def process_suggestion_feedback(
@@ -924,7 +1491,7 @@ Your core capabilities:
             return result
 
         except Exception as e:
-            logger.error(f"Error processing suggestion feedback: {e}")
+            logger.error("Error processing suggestion feedback: %s", e)
             return {"success": False, "error": str(e)}
 
     def get_suggestion_metrics(self) -> Dict[str, Any]:
@@ -941,7 +1508,7 @@ Your core capabilities:
             return {"success": True, "metrics": metrics}
 
         except Exception as e:
-            logger.error(f"Error getting suggestion metrics: {e}")
+            logger.error("Error getting suggestion metrics: %s", e)
             return {"success": False, "error": str(e), "metrics": {}}
 
     async def _handle_voice_command(self, voice_command):
@@ -949,7 +1516,7 @@ Your core capabilities:
         try:
             from ..system.voice_interface import VoiceCommandType
 
-            logger.info(f"Processing voice command: {voice_command.processed_text}")
+            logger.info("Processing voice command: %s", voice_command.processed_text)
 
             if voice_command.command_type == VoiceCommandType.SYSTEM_CONTROL:
                 # Handle system control commands
@@ -969,9 +1536,9 @@ Your core capabilities:
                 response = await self.process_user_input(
                     voice_command.processed_text, "voice_chat"
                 )
-                if response.get("success"):
+                if response.success:
                     await self.voice_interface.speak(
-                        response.get("message", "I'm here to help")
+                        response.message or "I'm here to help"
                     )
                 else:
                     await self.voice_interface.speak(
@@ -1007,7 +1574,7 @@ Your core capabilities:
                 )
 
         except Exception as e:
-            logger.error(f"Error handling voice command: {e}")
+            logger.error("Error handling voice command: %s", e)
             if self.voice_interface:
                 await self.voice_interface.speak(
                     "I encountered an error processing your command"
@@ -1029,7 +1596,7 @@ Your core capabilities:
                 ),
             }
         except Exception as e:
-            logger.error(f"Error starting voice interface: {e}")
+            logger.error("Error starting voice interface: %s", e)
             return {"success": False, "error": str(e)}
 
     async def stop_voice_interface(self) -> Dict[str, Any]:
@@ -1041,7 +1608,7 @@ Your core capabilities:
             await self.voice_interface.stop()
             return {"success": True, "message": "Voice interface stopped"}
         except Exception as e:
-            logger.error(f"Error stopping voice interface: {e}")
+            logger.error("Error stopping voice interface: %s", e)
             return {"success": False, "error": str(e)}
 
     async def start_voice_listening(self) -> Dict[str, Any]:
@@ -1053,7 +1620,7 @@ Your core capabilities:
             await self.voice_interface.start_listening()
             return {"success": True, "message": "Voice listening started"}
         except Exception as e:
-            logger.error(f"Error starting voice listening: {e}")
+            logger.error("Error starting voice listening: %s", e)
             return {"success": False, "error": str(e)}
 
     async def stop_voice_listening(self) -> Dict[str, Any]:
@@ -1065,7 +1632,7 @@ Your core capabilities:
             await self.voice_interface.stop_listening()
             return {"success": True, "message": "Voice listening stopped"}
         except Exception as e:
-            logger.error(f"Error stopping voice listening: {e}")
+            logger.error("Error stopping voice listening: %s", e)
             return {"success": False, "error": str(e)}
 
     def get_voice_metrics(self) -> Dict[str, Any]:
@@ -1081,7 +1648,7 @@ Your core capabilities:
             metrics = self.voice_interface.get_voice_metrics()
             return {"success": True, "metrics": metrics}
         except Exception as e:
-            logger.error(f"Error getting voice metrics: {e}")
+            logger.error("Error getting voice metrics: %s", e)
             return {"success": False, "error": str(e), "metrics": {}}
 
     def get_voice_status(self) -> Dict[str, Any]:
@@ -1097,7 +1664,7 @@ Your core capabilities:
             status = self.voice_interface.get_voice_status()
             return {"success": True, "status": status}
         except Exception as e:
-            logger.error(f"Error getting voice status: {e}")
+            logger.error("Error getting voice status: %s", e)
             return {"success": False, "error": str(e), "status": {}}
 
     async def execute_dynamic_code(self, 
@@ -1119,7 +1686,7 @@ Your core capabilities:
             Execution results including output, errors, and optionally visualizations
         """
         try:
-            logger.info(f"🧠 AI executing dynamic code for purpose: {purpose}")
+            logger.info("🧠 AI executing dynamic code for purpose: %s", purpose)
 
             # Log the routing decision with enhanced logging
             should_use_simple = self._should_use_simple_executor(code, purpose)
@@ -1187,7 +1754,7 @@ Your core capabilities:
 
             # Log execution for learning
             if result.get('success'):
-                logger.info(f"✅ Code execution successful for {purpose}")
+                logger.info("✅ Code execution successful for %s", purpose)
                 # Store successful patterns for future reference
                 await self.context_manager.update_context({
                     'code_execution': {
@@ -1198,13 +1765,13 @@ Your core capabilities:
                     }
                 })
             else:
-                logger.warning(f"⚠️ Code execution failed: {result.get('error')}")
-                logger.warning(f"Full execution result: {result}")
+                logger.warning("⚠️ Code execution failed: %s", result.get("error"))
+                logger.warning("Full execution result: %s", result)
 
             return result
 
         except Exception as e:
-            logger.error(f"❌ Error in execute_dynamic_code: {e}")
+            logger.error("❌ Error in execute_dynamic_code: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -1363,7 +1930,7 @@ Respond with:
             # Log success/failure for learning
             if result.get("success"):
                 logger.info(
-                    f"✅ Simple algorithm executed: {result.get('function_name')}"
+                    "✅ Simple algorithm executed: %s", result.get("function_name")
                 )
                 if self.context_manager:
                     await self.context_manager.update_context(
@@ -1377,12 +1944,12 @@ Respond with:
                         }
                     )
             else:
-                logger.warning(f"⚠️ Simple algorithm failed: {result.get('error')}")
+                logger.warning("⚠️ Simple algorithm failed: %s", result.get("error"))
 
             return result
 
         except Exception as e:
-            logger.error(f"❌ Error in simple algorithm execution: {e}")
+            logger.error("❌ Error in simple algorithm execution: %s", e)
             return {
                 "success": False,
                 "error": f"Simple algorithm execution error: {str(e)}",
@@ -1512,7 +2079,7 @@ Respond with JSON:
                 }
 
         except Exception as e:
-            logger.error(f"Error in execution recommendation: {e}")
+            logger.error("Error in execution recommendation: %s", e)
             return {
                 "recommendation": "simple_algorithm",
                 "reason": f"Error in analysis: {str(e)}",
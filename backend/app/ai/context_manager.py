@@ -12,9 +12,30 @@ import sqlite3
 from dataclasses import dataclass, asdict
 from collections import deque
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(value: Any) -> str:
+    """Serialize context payloads, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _loads(data: str) -> Any:
+    """Deserialize context payloads, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 @dataclass
 class ConversationExchange:
     """Single conversation exchange"""
@@ -131,7 +152,7 @@ class ConversationHistory:
                         exchange.user_message,
                         exchange.assistant_response,
                         exchange.context_type,
-                        json.dumps(exchange.metadata),
+                        _dumps(exchange.metadata),
                     ),
                 )
         except Exception as e:
@@ -166,7 +187,7 @@ class ConversationHistory:
                             user_message=row[1],
                             assistant_response=row[2],
                             context_type=row[3],
-                            metadata=json.loads(row[4]),
+                            metadata=_loads(row[4]),
                         )
                     )
                 return results
@@ -199,7 +220,7 @@ class ConversationHistory:
                             user_message=row[1],
                             assistant_response=row[2],
                             context_type=row[3],
-                            metadata=json.loads(row[4]),
+                            metadata=_loads(row[4]),
                         )
                     )
                 return results
@@ -250,8 +271,8 @@ class AgentKnowledge:
                     self.agents_info[agent_id] = {
                         "name": row[1],
                         "specialization": row[2],
-                        "capabilities": json.loads(row[3]),
-                        "performance_metrics": json.loads(row[4]),
+                        "capabilities": _loads(row[3]),
+                        "performance_metrics": _loads(row[4]),
                         "created_at": datetime.fromisoformat(row[5]),
                         "last_updated": datetime.fromisoformat(row[6]),
                     }
@@ -277,8 +298,8 @@ class AgentKnowledge:
                         agent_id,
                         info.get("name", "Unknown"),
                         info.get("specialization", "General"),
-                        json.dumps(info.get("capabilities", [])),
-                        json.dumps(info.get("performance_metrics", {})),
+                        _dumps(info.get("capabilities", [])),
+                        _dumps(info.get("performance_metrics", {})),
                         info.get("created_at", datetime.now()).isoformat(),
                         datetime.now().isoformat(),
                     ),
@@ -315,6 +336,9 @@ class ContextManager:
         self.context_cache = {}
         self.last_context_refresh = datetime.now()
 
+        # Bumped on every update so callers can tell when built context is stale
+        self.history_version = 0
+
         logger.info("ContextManager initialized")
 
     async def build_context(self, interaction_type: str, **kwargs) -> str:
@@ -339,7 +363,7 @@ class ContextManager:
         # Add user profile information
         if self.user_profile.preferences:
             context_parts.append(
-                f"User Preferences: {json.dumps(self.user_profile.preferences)}"
+                f"User Preferences: {_dumps(self.user_profile.preferences)}"
             )
 
         # Add relevant conversation history
@@ -394,6 +418,8 @@ class ContextManager:
             self.user_profile.preferences.update(interaction["user_preferences"])
             self.user_profile.last_updated = datetime.now()
 
+        self.history_version += 1
+
     async def get_relevant_history(
         self, query: str, limit: int = 10
     ) -> List[ConversationExchange]:
@@ -3,9 +3,10 @@ CelFlow Central AI Brain - Ollama Client
 Manages connection to local Ollama Gemma 3:4B model
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional, AsyncIterator
+from typing import Dict, Any, List, Optional, AsyncIterator, Union
 from datetime import datetime, timedelta
 
 import aiohttp
@@ -16,6 +17,14 @@ from pydantic import BaseModel
 logger = logging.getLogger(__name__)
 
 
+class OllamaAPIError(Exception):
+    """Non-200 reply from the Ollama API"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"Ollama API error {status}: {message}")
+        self.status = status
+
+
 class OllamaResponse(BaseModel):
     """Structured response from Ollama API"""
 
@@ -27,6 +36,7 @@ class OllamaResponse(BaseModel):
     load_duration: Optional[int] = None
     prompt_eval_count: Optional[int] = None
     eval_count: Optional[int] = None
+    context: Optional[List[int]] = None
 
 
 class OllamaClient:
@@ -40,6 +50,12 @@ class OllamaClient:
         self.max_tokens = config.get("max_tokens", 2048)
         self.temperature = config.get("temperature", 0.7)
         self.context_window = config.get("context_window", 8192)
+        self.embedding_model = config.get("embedding_model", "nomic-embed-text")
+        # Keep the model (and its KV cache) resident between turns
+        self.keep_alive = config.get("keep_alive", "30m")
+        # Concurrent generation slots; should match OLLAMA_NUM_PARALLEL on the server
+        self.num_parallel = config.get("num_parallel", 4)
+        self._parallel_slots: Optional[asyncio.Semaphore] = None
 
         # Initialize session and tokenizer
         self.session: Optional[aiohttp.ClientSession] = None
@@ -112,17 +128,19 @@ class OllamaClient:
             logger.error(f"Model health check failed: {e}")
             return False
 
-    async def _make_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def _make_request(
+        self, payload: Dict[str, Any], endpoint: str = "generate"
+    ) -> Dict[str, Any]:
         """Make HTTP request to Ollama API"""
         if not self.session:
             await self.start()
 
-        url = f"{self.base_url}/api/generate"
+        url = f"{self.base_url}/api/{endpoint}"
 
         async with self.session.post(url, json=payload) as response:
             if response.status != 200:
                 error_text = await response.text()
-                raise Exception(f"Ollama API error {response.status}: {error_text}")
+                raise OllamaAPIError(response.status, error_text)
 
             return await response.json()
 
@@ -138,13 +156,60 @@ class OllamaClient:
             logger.warning(f"Token counting failed: {e}")
             return len(text.split()) * 1.3
 
+    async def embed(self, text: str) -> List[float]:
+        """Get an embedding vector for text from the embedding model"""
+        response_data = await self._make_request(
+            {
+                "model": self.embedding_model,
+                "input": text,
+                "keep_alive": self.keep_alive,
+            },
+            endpoint="embed",
+        )
+
+        embeddings = response_data.get("embeddings") or []
+        if not embeddings:
+            raise Exception(f"No embedding returned by {self.embedding_model}")
+        return embeddings[0]
+
     async def generate_response(
         self,
         prompt: str,
         context: Optional[Dict[str, Any]] = None,
         system_prompt: Optional[str] = None,
+        response_format: Optional[Union[str, Dict[str, Any]]] = None,
+        model: Optional[str] = None,
     ) -> str:
         """Generate response with context awareness"""
+        completion = await self.generate_completion(
+            prompt,
+            context,
+            system_prompt,
+            response_format=response_format,
+            model=model,
+        )
+        return completion.content
+
+    async def generate_completion(
+        self,
+        prompt: str,
+        context: Optional[Dict[str, Any]] = None,
+        system_prompt: Optional[str] = None,
+        context_tokens: Optional[List[int]] = None,
+        keep_alive: Optional[str] = None,
+        response_format: Optional[Union[str, Dict[str, Any]]] = None,
+        model: Optional[str] = None,
+    ) -> OllamaResponse:
+        """Generate a completion and return it with Ollama's context tokens
+
+        When ``context_tokens`` from a previous completion are given, only
+        the new turn is sent: Ollama prepends the tokens it already holds in
+        its KV cache instead of re-prefilling the system prompt and history.
+
+        ``response_format`` is passed as Ollama's ``format``: ``"json"`` or a
+        JSON schema, enforced while sampling so the output always parses.
+        ``model`` overrides the configured model for this request only.
+        """
 
         # Check model health periodically
         if (
@@ -156,8 +221,12 @@ class OllamaClient:
         if not self.is_healthy:
             raise Exception("Model is not healthy")
 
-        # Build full prompt with system context
-        full_prompt = self._build_full_prompt(prompt, context, system_prompt)
+        if context_tokens:
+            # Cached prefix: append the new turn only
+            full_prompt = self._build_full_prompt(prompt)
+        else:
+            # Build full prompt with system context
+            full_prompt = self._build_full_prompt(prompt, context, system_prompt)
 
         # Ensure we don't exceed context window
         token_count = await self.count_tokens(full_prompt)
@@ -165,10 +234,12 @@ class OllamaClient:
             logger.warning(f"Prompt too long ({token_count} tokens), truncating")
             full_prompt = self._truncate_prompt(full_prompt)
 
+        model = model or self.model_name
         payload = {
-            "model": self.model_name,
+            "model": model,
             "prompt": full_prompt,
             "stream": False,
+            "keep_alive": keep_alive or self.keep_alive,
             "options": {
                 "num_predict": self.max_tokens,
                 "temperature": self.temperature,
@@ -176,15 +247,30 @@ class OllamaClient:
                 "top_k": 40,
             },
         }
+        if context_tokens:
+            payload["context"] = context_tokens
+        if response_format:
+            payload["format"] = response_format
 
         try:
-            response_data = await self._make_request(payload)
+            async with self._slots():
+                response_data = await self._make_request(payload)
             content = response_data.get("response", "").strip()
 
             # Log interaction for monitoring
             logger.info(f"Generated response: {len(content)} characters")
 
-            return content
+            return OllamaResponse(
+                content=content,
+                model=response_data.get("model", model),
+                created_at=datetime.now(),
+                done=response_data.get("done", True),
+                total_duration=response_data.get("total_duration"),
+                load_duration=response_data.get("load_duration"),
+                prompt_eval_count=response_data.get("prompt_eval_count"),
+                eval_count=response_data.get("eval_count"),
+                context=response_data.get("context"),
+            )
 
         except Exception as e:
             logger.error(f"Response generation failed: {e}")
@@ -195,6 +281,7 @@ class OllamaClient:
         prompt: str,
         context: Optional[Dict[str, Any]] = None,
         system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
     ) -> AsyncIterator[str]:
         """Stream real-time responses for chat interface"""
 
@@ -206,9 +293,10 @@ class OllamaClient:
         full_prompt = self._build_full_prompt(prompt, context, system_prompt)
 
         payload = {
-            "model": self.model_name,
+            "model": model or self.model_name,
             "prompt": full_prompt,
             "stream": True,
+            "keep_alive": self.keep_alive,
             "options": {
                 "num_predict": self.max_tokens,
                 "temperature": self.temperature,
@@ -218,7 +306,9 @@ class OllamaClient:
         url = f"{self.base_url}/api/generate"
 
         try:
-            async with self.session.post(url, json=payload) as response:
+            # A stream occupies a server slot until it finishes, so it holds
+            # one of ours for as long as it is being consumed
+            async with self._slots(), self.session.post(url, json=payload) as response:
                 if response.status != 200:
                     error_text = await response.text()
                     raise Exception(f"Ollama API error {response.status}: {error_text}")
@@ -238,6 +328,14 @@ class OllamaClient:
             logger.error(f"Streaming response failed: {e}")
             raise
 
+    def _slots(self) -> asyncio.Semaphore:
+        """Semaphore capping in-flight generations at the server's parallel slots"""
+        # Created lazily so it binds to the running event loop; extra callers
+        # queue here instead of on Ollama's side
+        if self._parallel_slots is None:
+            self._parallel_slots = asyncio.Semaphore(max(1, self.num_parallel))
+        return self._parallel_slots
+
     def _build_full_prompt(
         self,
         prompt: str,
@@ -269,19 +367,22 @@ class OllamaClient:
     def _truncate_prompt(self, prompt: str) -> str:
         """Truncate prompt to fit context window"""
         max_tokens = self.context_window - self.max_tokens - 100  # Safety margin
+        return self.truncate_to_tokens(prompt, max_tokens)
 
+    def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """Keep only the last ``max_tokens`` tokens of text"""
         if not self.tokenizer:
             # Simple truncation by characters
             max_chars = max_tokens * 4  # Rough estimate
-            return prompt[-max_chars:]
+            return text[-max_chars:]
 
         # Truncate by tokens
-        tokens = self.tokenizer.encode(prompt)
+        tokens = self.tokenizer.encode(text)
         if len(tokens) > max_tokens:
             truncated_tokens = tokens[-max_tokens:]
             return self.tokenizer.decode(truncated_tokens)
 
-        return prompt
+        return text
 
     async def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model"""
@@ -132,6 +132,69 @@ class SystemAction:
     results: Optional[Dict[str, Any]] = None
 
 
+def _string_list() -> Dict[str, Any]:
+    """JSON schema for a list of strings"""
+    return {"type": "array", "items": {"type": "string"}}
+
+
+def _object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON schema for an object requiring every listed property"""
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+# JSON schema Ollama enforces while decoding the command analysis. Keep it in
+# sync with the response format described in prompts/system_control.txt.
+SYSTEM_ACTION_SCHEMA = _object(
+    {
+        "intent_analysis": _object(
+            {
+                "primary_goal": {"type": "string"},
+                "command_type": {"enum": [t.value for t in CommandType]},
+                "complexity_level": {"enum": [c.value for c in ComplexityLevel]},
+                "parameters_extracted": {"type": "string"},
+            }
+        ),
+        "capability_assessment": _object(
+            {
+                "required_capabilities": _string_list(),
+                "feasibility_score": {"type": "integer", "minimum": 1, "maximum": 10},
+                "required_agents": _string_list(),
+            }
+        ),
+        "safety_validation": _object(
+            {
+                "risk_level": {"enum": [r.value for r in RiskLevel]},
+                "safety_concerns": _string_list(),
+                "validation_status": {"enum": [v.value for v in ValidationStatus]},
+            }
+        ),
+        "action_plan": _object(
+            {
+                "execution_steps": _string_list(),
+                "estimated_duration": {"type": "number"},
+                "success_criteria": _string_list(),
+            }
+        ),
+        "recommended_action": _object(
+            {
+                "action_type": {"enum": [a.value for a in ActionType]},
+                "justification": {"type": "string"},
+                "user_feedback": {"type": "string"},
+                "next_steps": _string_list(),
+            }
+        ),
+    }
+)
+
+
+def _enum_member(enum_cls, value: Any, default: Enum) -> Enum:
+    """Look up an enum member by value, falling back to ``default``"""
+    try:
+        return enum_cls(str(value).lower())
+    except ValueError:
+        return default
+
+
 class SystemController:
     """
     Intelligent system controller for command translation and execution.
@@ -449,9 +512,12 @@ class SystemController:
             formatted_prompt = prompt_template.format(**context)
 
             # Get AI response
+            # Constrain decoding to the action schema so the reply always parses
             response = await self.central_brain.ollama_client.generate_response(
                 formatted_prompt,
                 context={"type": "system_control", "command": context["user_command"]},
+                response_format=SYSTEM_ACTION_SCHEMA,
+                model=self.central_brain.model_routes.get("system_control"),
             )
 
             return response
@@ -465,32 +531,24 @@ class SystemController:
     ) -> SystemAction:
         """Parse AI response into structured SystemAction"""
         try:
-            # Extract structured sections from AI response
-            sections = self._extract_response_sections(ai_response)
-
-            # Parse intent analysis
-            intent_analysis = self._parse_intent_analysis(
-                sections.get("INTENT ANALYSIS", "")
-            )
-
-            # Parse capability assessment
-            capability_assessment = self._parse_capability_assessment(
-                sections.get("CAPABILITY ASSESSMENT", "")
-            )
-
-            # Parse safety validation
-            safety_validation = self._parse_safety_validation(
-                sections.get("SAFETY VALIDATION", "")
-            )
-
-            # Parse action plan
-            action_plan = self._parse_action_plan(sections.get("ACTION PLAN", ""))
+            try:
+                analysis = json.loads(ai_response)
+            except ValueError:
+                analysis = None
+
+            if isinstance(analysis, dict):
+                # Schema-constrained reply: read the fields directly
+                components = self._parse_json_analysis(analysis)
+            else:
+                components = self._parse_markdown_analysis(ai_response)
 
-            # Parse recommended action
-            recommended_section = sections.get("RECOMMENDED ACTION", "")
-            recommended_action, justification, user_feedback, next_steps = (
-                self._parse_recommended_action(recommended_section)
-            )
+            (
+                intent_analysis,
+                capability_assessment,
+                safety_validation,
+                action_plan,
+                (recommended_action, justification, user_feedback, next_steps),
+            ) = components
 
             return SystemAction(
                 action_id=action_id,
@@ -509,6 +567,118 @@ class SystemController:
             logger.error(f"Error parsing AI response: {e}")
             return await self._create_fallback_action(user_command, f"Parse error: {e}")
 
+    def _parse_markdown_analysis(self, ai_response: str) -> tuple:
+        """Parse a markdown analysis, as produced by the fallback analysis"""
+        # Extract structured sections from AI response
+        sections = self._extract_response_sections(ai_response)
+
+        # Parse intent analysis
+        intent_analysis = self._parse_intent_analysis(
+            sections.get("INTENT ANALYSIS", "")
+        )
+
+        # Parse capability assessment
+        capability_assessment = self._parse_capability_assessment(
+            sections.get("CAPABILITY ASSESSMENT", "")
+        )
+
+        # Parse safety validation
+        safety_validation = self._parse_safety_validation(
+            sections.get("SAFETY VALIDATION", "")
+        )
+
+        # Parse action plan
+        action_plan = self._parse_action_plan(sections.get("ACTION PLAN", ""))
+
+        # Parse recommended action
+        recommended = self._parse_recommended_action(
+            sections.get("RECOMMENDED ACTION", "")
+        )
+
+        return (
+            intent_analysis,
+            capability_assessment,
+            safety_validation,
+            action_plan,
+            recommended,
+        )
+
+    def _parse_json_analysis(self, analysis: Dict[str, Any]) -> tuple:
+        """Build the analysis components from a SYSTEM_ACTION_SCHEMA reply"""
+        intent = analysis.get("intent_analysis", {})
+        capability = analysis.get("capability_assessment", {})
+        safety = analysis.get("safety_validation", {})
+        plan = analysis.get("action_plan", {})
+        recommended = analysis.get("recommended_action", {})
+
+        parameters = intent.get("parameters_extracted", "")
+        intent_analysis = IntentAnalysis(
+            primary_goal=intent.get("primary_goal") or "Unknown goal",
+            command_type=_enum_member(
+                CommandType, intent.get("command_type"), CommandType.QUERY
+            ),
+            complexity_level=_enum_member(
+                ComplexityLevel,
+                intent.get("complexity_level"),
+                ComplexityLevel.SIMPLE,
+            ),
+            parameters=(
+                {"raw_params": parameters}
+                if parameters and parameters != "None"
+                else {}
+            ),
+            confidence_score=0.8,
+        )
+
+        capability_assessment = CapabilityAssessment(
+            required_capabilities=list(capability.get("required_capabilities", [])),
+            available_resources={},
+            feasibility_score=max(
+                1, min(10, int(capability.get("feasibility_score", 5)))
+            ),
+            required_agents=list(capability.get("required_agents", [])),
+            resource_requirements={},
+        )
+
+        safety_validation = SafetyValidation(
+            risk_level=_enum_member(RiskLevel, safety.get("risk_level"), RiskLevel.LOW),
+            safety_concerns=list(safety.get("safety_concerns", [])),
+            permission_requirements=[],
+            validation_status=_enum_member(
+                ValidationStatus,
+                safety.get("validation_status"),
+                ValidationStatus.SAFE,
+            ),
+            warnings=[],
+        )
+
+        action_plan = ActionPlan(
+            execution_steps=[
+                {"step": step} for step in plan.get("execution_steps", [])
+            ],
+            estimated_duration=float(plan.get("estimated_duration", 5.0)),
+            success_criteria=list(plan.get("success_criteria", [])),
+            rollback_plan=[],
+            dependencies=[],
+        )
+
+        return (
+            intent_analysis,
+            capability_assessment,
+            safety_validation,
+            action_plan,
+            (
+                _enum_member(
+                    ActionType,
+                    recommended.get("action_type"),
+                    ActionType.REQUEST_CLARIFICATION,
+                ),
+                recommended.get("justification", ""),
+                recommended.get("user_feedback", ""),
+                list(recommended.get("next_steps", [])),
+            ),
+        )
+
     def _extract_response_sections(self, response: str) -> Dict[str, str]:
         """Extract structured sections from AI response"""
         sections = {}
@@ -896,9 +1066,6 @@ class SystemController:
             step_description = step.get("step", "Unknown step")
             logger.info(f"Executing step: {step_description}")
 
-            # Simulate step execution
-            await asyncio.sleep(0.1)
-
             return {
                 "success": True,
                 "step": step_description,
@@ -328,9 +328,12 @@ class CentralIntegration:
             session_id = interaction.input_data.get("session_id", "default")
 
             # Use UserInterfaceAgent for natural language processing
-            response = await self.central_brain.process_user_input(
-                user_message, session_id
-            )
+            response = (
+                await self.central_brain.process_user_input(
+                    user_message,
+                    session_id=interaction.input_data.get("session_id"),
+                )
+            ).to_dict()
 
             interaction.agents_involved.append("UserInterfaceAgent")
 
@@ -444,7 +447,7 @@ class CentralIntegration:
             )
             interaction.agents_involved.append("UserInterfaceAgent")
 
-            return response
+            return response.to_dict()
 
         except Exception as e:
             logger.error(f"Query request processing error: {e}")
@@ -492,7 +495,7 @@ class CentralIntegration:
 
             interaction.agents_involved.append("UserInterfaceAgent")
 
-            return response
+            return response.to_dict()
 
         except Exception as e:
             logger.error(f"Generic interaction processing error: {e}")
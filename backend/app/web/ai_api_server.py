@@ -169,6 +169,7 @@ def load_config() -> Dict[str, Any]:
             'temperature': ai_config['model']['temperature'],
             'max_tokens': ai_config['model']['max_tokens'],
             'context_window': ai_config['model']['context_window'],
+            'num_parallel': ai_config['model'].get('num_parallel', 4),
             'timeout': 30
         }
         
@@ -184,6 +185,7 @@ def load_config() -> Dict[str, Any]:
                 'temperature': 0.7,
                 'max_tokens': 2048,
                 'context_window': 8192,
+                'num_parallel': 4,
                 'timeout': 30
             }
         }